@@ -60,13 +60,15 @@ async def main():
 
     # Even there is no _id field in the model, the _id field of ObjectId type, which represents
     # document id provided by MongoDB, is injected thanks to inject_default_id=True option.
-    assert hasattr(vasya, '_id')
-    vasya_id = getattr(vasya, '_id')
+    # It can be accessed with getattr(vasya, '_id') or, cheaper and typed, with pymotyc.id_of().
+    vasya_id = pymotyc.id_of(vasya)
     assert isinstance(vasya_id, ObjectId)
 
-    # Let's add some more Employees.
-    await Warehouse.employees.save(Employee(name='Frosya Taburetkina', age=22))
-    await Warehouse.employees.save(Employee(name='Dusya Ivanova', age=20))
+    # Let's add some more Employees, all of them at once with single request to MongoDB.
+    await Warehouse.employees.save_many([
+        Employee(name='Frosya Taburetkina', age=22),
+        Employee(name='Dusya Ivanova', age=20),
+    ])
 
     # Let's explore our collection now...
 
@@ -10,13 +10,13 @@ There are some more concepts demonstrated:
 
 For basic usage see app_quickstart.py, here only advanced concepts will be commented.
 
-Here we have employee_id field in the model to represent identity. It is of type str and contains UUID
+Here we have employee_id field in the model to represent identity. It is of type str and contains ObjectId
 in str representation, which will be generated by PyMotyc while saving model instance with empty identity.
 Identity generation callable can be provided for collection, if default is not applicable.
 """
 import asyncio
-import uuid
 
+from bson import ObjectId
 from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel
 
@@ -62,13 +62,16 @@ async def main():
     assert isinstance(vasya, Employee)
 
     vasya_id = vasya.employee_id
-    assert uuid.UUID(vasya_id)  # vasya's identity is generated by PyMotyc and it is UUID in str representation
+    assert ObjectId.is_valid(vasya_id)  # vasya's identity is generated by PyMotyc and it is ObjectId in str representation
 
     # Let's add some more Employees.
-    frosya = await Warehouse.employees.save(Employee(name='Frosya Taburetkina', age=22))
+    # Saves are independent of each other, so they can run concurrently with asyncio.gather
+    # to overlap waiting for MongoDB. Dependent operations (like modifying vasya below) must stay sequential.
+    frosya, dusya = await asyncio.gather(
+        Warehouse.employees.save(Employee(name='Frosya Taburetkina', age=22)),
+        Warehouse.employees.save(Employee(name='Dusya Ivanova', age=20)),
+    )
     frosya_id = frosya.employee_id
-
-    dusya = await Warehouse.employees.save(Employee(name='Dusya Ivanova', age=20))
     dusya_id = dusya.employee_id
 
     # Let's explore our collection now...
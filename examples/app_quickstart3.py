@@ -13,7 +13,6 @@ For basic usage see app_quickstart.py, app_quickstart2.py
 """
 
 import asyncio
-import uuid
 from datetime import datetime
 from typing import Union, List
 
@@ -46,7 +45,7 @@ ProductId = str
 
 class ProductBase(MotycModel):
     kind: str  # key for discriminated union
-    product_id: ProductId = None  # identity, UUID generated by PyMotyc
+    product_id: ProductId = None  # identity, ObjectId in str representation generated by PyMotyc
 
 
 class Book(ProductBase):
@@ -112,31 +111,35 @@ async def main():
     await engine.bind(motor=motor, inject_motyc_fields=True)
 
     # todo: database drop
-    await Warehouse.employees.collection.drop()
-    await Warehouse.employees.create_indexes()
-
-    await Warehouse.products.collection.drop()
-    await Warehouse.products.create_indexes()
-
-    await Warehouse.suppliers.collection.drop()
-    await Warehouse.suppliers.create_indexes()
-
-    await Warehouse.orders.collection.drop()
-    await Warehouse.orders.create_indexes()
+    async def recreate(collection: Collection):
+        await collection.collection.drop()  # must precede indexes creation
+        await collection.create_indexes()
+
+    # Collections are independent, so they can be recreated concurrently.
+    await asyncio.gather(*(
+        recreate(collection)
+        for collection in [Warehouse.employees, Warehouse.products, Warehouse.suppliers, Warehouse.orders]
+    ))
 
     # ----------------------------------------------------
     # Filling
 
-    await Warehouse.employees.save(Employee(name='Vasya Pupkin', age=42))
-    await Warehouse.employees.save(Employee(name='Frosya Taburetkina', age=22))
-
-    await Warehouse.products.save(Book(title='Hamlet', pages=42))
-    await Warehouse.products.save(Book(title='Harry Potter', pages=442))
-    await Warehouse.products.save(Computer(vendor='apple'))
-    await Warehouse.products.save(Computer(vendor='hp'))
-
-    await Warehouse.suppliers.save(Supplier(name='GUM', location=Address(index=109012, address="Red sq. 3, Moscow, Russia")))
-    await Warehouse.suppliers.save(Supplier(name='CUM', location=Address(index=125009, address="Petrovka st. 2, Moscow, Russia")))
+    # New documents can be inserted with single request to MongoDB,
+    # and independent requests can run concurrently with asyncio.gather.
+    await asyncio.gather(
+        Warehouse.employees.save_many([
+            Employee(name='Vasya Pupkin', age=42),
+            Employee(name='Frosya Taburetkina', age=22),
+        ]),
+        Warehouse.products.save_many([
+            Book(title='Hamlet', pages=42),
+            Book(title='Harry Potter', pages=442),
+            Computer(vendor='apple'),
+            Computer(vendor='hp'),
+        ]),
+        Warehouse.suppliers.save(Supplier(name='GUM', location=Address(index=109012, address="Red sq. 3, Moscow, Russia"))),
+        Warehouse.suppliers.save(Supplier(name='CUM', location=Address(index=125009, address="Petrovka st. 2, Moscow, Russia"))),
+    )
 
     # ----------------------------------------------------
     # Exploration
@@ -147,12 +150,12 @@ async def main():
 
     # Discriminated union collection, with query builder
     product = await Warehouse.products.find_one((M(ProductBase.kind) == 'book') & (M(Book.title) == 'Hamlet'))
-    assert uuid.UUID(product.product_id)  # UUID generated by PyMotyc
+    assert ObjectId.is_valid(product.product_id)  # generated by PyMotyc
     assert isinstance(product, Book)
     assert product.pages == 42
 
-    # Query builder for nested model
-    supplier = await Warehouse.suppliers.find_one(M(Supplier.location.address).regex('Red'))
+    # Query builder for nested model, prefix search can use index on 'location.address'
+    supplier = await Warehouse.suppliers.find_one(M(Supplier.location.address).startswith('Red'))
     assert supplier.name == 'GUM'
 
     # ----------------------------------------------------
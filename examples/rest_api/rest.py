@@ -1,8 +1,8 @@
 """
-Simple REST API for CRUD operations, when identity is string representation of uuid, generated by PyMotyc 
+Simple REST API for CRUD operations, when identity is string representation of ObjectId, generated by PyMotyc 
 and is part of model, which is single one and used both on database and network level.
 
-Using PyMotyc generated uuid as resource id is very convenient, and much much more easier then to rely
+Using PyMotyc generated str id as resource id is very convenient, and much much more easier then to rely
 on Mongo's ObjectId, cause we avoid lot of headache with ObjectId serialization and conversions.
 
 This is reference design of API to use with PyMotyc.
@@ -11,11 +11,10 @@ Keeping id Optional is not so elegant, but it allows us to have single model
 for everything (input, output and database).
 
 """
-import uuid
 from typing import List
 
+from bson import ObjectId
 from fastapi import FastAPI, Query, HTTPException
-from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel
 from pymongo.errors import DuplicateKeyError
 from starlette.responses import JSONResponse
@@ -27,7 +26,7 @@ import pymotyc
 # ----------------------------------------------------
 
 class Employee(BaseModel):
-    id: str = None  # UUID in str representation, will be generated by PyMotyc
+    id: str = None  # ObjectId in str representation, will be generated by PyMotyc
     full_name: str
     age: int
 
@@ -53,7 +52,7 @@ app = FastAPI(
 
 @app.on_event("startup")
 async def init_app():
-    motor = AsyncIOMotorClient("mongodb://127.0.0.1:27017")
+    motor = pymotyc.get_client("mongodb://127.0.0.1:27017")
     await engine.bind(motor=motor, inject_motyc_fields=True)
     await Warehouse.employees.collection.drop()
     await Warehouse.employees.create_indexes()
@@ -127,7 +126,7 @@ if __name__ == "__main__":
         assert response.status_code == 201
         vasya = response.json()
         vasya_id = vasya['id']
-        assert uuid.UUID(vasya_id)  # Vasya's id is str representation of uuid, generated by pymotyc.
+        assert ObjectId.is_valid(vasya_id)  # Vasya's id is str representation of ObjectId, generated by pymotyc.
         assert vasya == {'id': vasya_id, 'full_name': 'Vasya Pupkin', 'age': 42}
 
         response = cli.post('/employees', json={'full_name': 'Frosya Taburetkina', 'age': 20})
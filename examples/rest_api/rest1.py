@@ -8,7 +8,6 @@ Here we use POST to create resource and PUT only to modify known one.
 from typing import List
 
 from fastapi import FastAPI, HTTPException, Query
-from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel
 from pymongo.errors import DuplicateKeyError
 from starlette.responses import JSONResponse
@@ -46,7 +45,7 @@ app = FastAPI(
 
 @app.on_event("startup")
 async def init_app():
-    motor = AsyncIOMotorClient("mongodb://127.0.0.1:27017")
+    motor = pymotyc.get_client("mongodb://127.0.0.1:27017")
     await engine.bind(motor=motor, inject_motyc_fields=True)
     await Warehouse.employees.collection.drop()
     await Warehouse.employees.create_indexes()
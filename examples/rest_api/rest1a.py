@@ -10,7 +10,7 @@ This shows usage of __created__ injected field.
 from typing import List
 
 from fastapi import FastAPI, HTTPException, Query
-from motor.motor_asyncio import AsyncIOMotorClient
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from pymongo.errors import DuplicateKeyError
 from starlette.responses import JSONResponse, Response
@@ -37,18 +37,23 @@ class Warehouse:
     employees: pymotyc.Collection[Employee] = pymotyc.Collection(identity='login')
 
 
+# Query factory for the identity, built once, not on every request.
+by_login = pymotyc.filter_by('login')
+
+
 # ----------------------------------------------------
 
 app = FastAPI(
     title='Warehouse',
     description='Simple Warehouse CRUD service for Employees, client-managed identity.',
     version="0.1.0",
+    default_response_class=ORJSONResponse,  # orjson is much faster than stdlib json on large lists
 )
 
 
 @app.on_event("startup")
 async def init_app():
-    motor = AsyncIOMotorClient("mongodb://127.0.0.1:27017")
+    motor = pymotyc.get_client("mongodb://127.0.0.1:27017")
     await engine.bind(motor=motor, inject_motyc_fields=True)
     await Warehouse.employees.collection.drop()
     await Warehouse.employees.create_indexes()
@@ -81,13 +86,13 @@ async def put_employee(login: str, employee: Employee, response: Response) -> Em
 @app.get('/employees', response_model=List[Employee])
 async def list_employees() -> List[Employee]:
     """ Returns employees list from database ordered by login. """
-    return await Warehouse.employees.find(sort={Employee.login: 1})
+    return await Warehouse.employees.find(sort={Employee.login: 1}, batch_size=500)
 
 
 @app.get('/employees/{login}', response_model=Employee)
 async def get_employee(login: str) -> Employee:
     """ Returns employee from database by it's login. """
-    return await Warehouse.employees.find_one({Employee.login: login})
+    return await Warehouse.employees.find_one(by_login(login))
 
 
 @app.patch('/employees/{login}', response_model=Employee)
@@ -95,7 +100,7 @@ async def patch_employee(login: str, inc_age: int = Query(1)) -> Employee:
     """ Increments employee's age by given login. """
 
     return await Warehouse.employees.update_one(
-        {Employee.login: login},
+        by_login(login),
         update={'$inc': {Employee.age: inc_age}}
     )
 
@@ -103,7 +108,7 @@ async def patch_employee(login: str, inc_age: int = Query(1)) -> Employee:
 @app.delete('/employees/{login}', status_code=204)
 async def delete_employee(login: str):
     """ Delete employee with given login from database. """
-    await Warehouse.employees.delete_one({Employee.login: login})
+    await Warehouse.employees.delete_one(by_login(login))
 
 
 if __name__ == "__main__":
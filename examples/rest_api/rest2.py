@@ -15,7 +15,7 @@ from typing import List, Tuple
 
 from bson import ObjectId
 from fastapi import FastAPI, Query
-from motor.motor_asyncio import AsyncIOMotorClient
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from pymongo import IndexModel
 from pymongo.errors import DuplicateKeyError
@@ -51,12 +51,13 @@ app = FastAPI(
     title='Warehouse',
     description='Simple Warehouse CRUD service for Employees, detached identity.',
     version="0.1.0",
+    default_response_class=ORJSONResponse,  # orjson is much faster than stdlib json on large lists
 )
 
 
 @app.on_event("startup")
 async def init_app():
-    motor = AsyncIOMotorClient("mongodb://127.0.0.1:27017")
+    motor = pymotyc.get_client("mongodb://127.0.0.1:27017")
     await engine.bind(motor=motor, inject_motyc_fields=True)
     await Warehouse.employees.collection.drop()
     await Warehouse.employees.create_indexes()
@@ -80,17 +81,13 @@ async def exists_or_constrain_violation(_request, exc):
 async def create_employee(employee: Employee) -> EmployeeOut:
     """ Creates employee in database, login should be unique. """
     employee = await Warehouse.employees.save(employee, inject_default_id=True)
-    return str(getattr(employee, '_id')), employee
+    return str(pymotyc.id_of(employee)), employee
 
 
 @app.get('/employees', response_model=List[EmployeeOut])
 async def list_employees() -> List[EmployeeOut]:
     """ Returns employees list from database ordered by login. """
-    employees = await Warehouse.employees.find(sort={Employee.login: 1}, inject_default_id=True)
-    return [
-        (str(getattr(employee, '_id')), employee)
-        for employee in employees
-    ]
+    return await Warehouse.employees.find_with_ids(sort={Employee.login: 1}, batch_size=500)
 
 
 @app.get('/employees/{_id}', response_model=Employee)
@@ -6,7 +6,7 @@ and all those points are out of scope of PyMotyc, which is only manages app<->da
 while serialization of the model for network communication is not part of it, so we do it by hands,
 converting database model to network one and vise versa.
 
-For that reason, it is much much easier to use str representation of uuid, generated by PyMotyc
+For that reason, it is much much easier to use str representation of ObjectId, generated by PyMotyc
 as resource id, which is covered in rest.py and is a recommended way to use pymotyc.
 
 https://github.com/tiangolo/fastapi/issues/1515
@@ -15,7 +15,6 @@ from typing import List
 
 from bson import ObjectId
 from fastapi import FastAPI, Query
-from motor.motor_asyncio import AsyncIOMotorClient
 from pydantic import BaseModel, parse_obj_as, parse_raw_as
 from pymongo.errors import DuplicateKeyError
 from starlette.responses import JSONResponse
@@ -60,7 +59,7 @@ app = FastAPI(
 
 @app.on_event("startup")
 async def init_app():
-    motor = AsyncIOMotorClient("mongodb://127.0.0.1:27017")
+    motor = pymotyc.get_client("mongodb://127.0.0.1:27017")
     await engine.bind(motor=motor, inject_motyc_fields=True)
     await Warehouse.employees.collection.drop()
     await Warehouse.employees.create_indexes()
@@ -99,7 +98,7 @@ async def create_employee(employee: EmployeeIn) -> EmployeeOut:
     # Then we use parse_raw_as, to construct network model EmployeeOut.
     # Of cause this is just one approach (slow one btw) to serialize database model,
     # but again - it's not a topic of PyMotyc, we propose to use it with
-    # generated uuids as resource id.
+    # generated str ids as resource id.
     return parse_raw_as(EmployeeOut, employee.json())
 
 
@@ -1,6 +1,6 @@
-from .engine import Engine
+from .engine import Engine, get_client
 from .collection import Collection
 from .database import Database
-from .query import M
-from .model import MotycModel, WithId
+from .query import M, filter_by
+from .model import MotycModel, WithId, id_of
 from . import errors
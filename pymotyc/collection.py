@@ -1,13 +1,16 @@
-from typing import TypeVar, Generic, List, Optional, Union, Type, Iterable, Callable, cast
-from uuid import uuid4
+import asyncio
+import types
+from enum import Enum
+from functools import partial
+from typing import TypeVar, Generic, List, Optional, Union, Type, Iterable, Callable, AsyncIterator, Tuple, Dict, Any
 
-import typing_inspect
 from bson import ObjectId
 from motor.core import AgnosticCollection, AgnosticDatabase, AgnosticCursor
-from pydantic import parse_obj_as, BaseModel
-from pymongo import IndexModel, ReturnDocument
-from pymongo.results import InsertOneResult, UpdateResult, DeleteResult
-from typing_extensions import Literal
+from pydantic import parse_obj_as, BaseModel, Extra, create_model
+from pydantic.typing import display_as_type
+from pymongo import IndexModel, ReturnDocument, InsertOne, UpdateOne
+from pymongo.results import InsertOneResult, UpdateResult, DeleteResult, BulkWriteResult
+from typing_extensions import Literal, get_origin, get_args
 
 from pymotyc import Engine
 from pymotyc.errors import NotFound
@@ -15,8 +18,32 @@ from pymotyc.query import MotycQuery, MotycField
 
 T = TypeVar('T', bound=BaseModel)
 
+# Values which .dict() converts instead of copying as is: models, containers and enums (for use_enum_values).
+_dict_converted_types = (BaseModel, dict, list, tuple, set, frozenset, Enum)
+
+# Origins of Union types, including X | Y syntax of Python 3.10+.
+_union_origins = (Union, getattr(types, 'UnionType', Union))
+
 
 class Collection(Generic[T]):
+    # Collection name, set to database class attribute name during binding if not provided.
+    name: Optional[str]
+
+    # Document's field name, which represents identity.
+    identity: str
+
+    # Indexes to create for collection, see create_indexes().
+    indexes: Iterable[Union[str, IndexModel]]
+
+    # Callable to generate ids for non-default identity management.
+    id_generator: Callable[[], Any]
+
+    # Should documents be parsed without validation by default.
+    trust_db: bool
+
+    # Is identity the Mongo's _id, resolved once from identity.
+    _identity_is_default: bool
+
     # Motor collection.
     collection: AgnosticCollection
 
@@ -26,6 +53,30 @@ class Collection(Generic[T]):
     # Type of the collection, should be BaseModel or Union of them.
     t: type
 
+    # Is type of the collection a Union of models, resolved once during binding.
+    _is_union: bool
+
+    # Projection of the fields declared in the model(s), None if models allow extra fields
+    # or have pre validators, which can read (i.e. migrate) stored keys not declared in the model.
+    default_projection: Optional[dict]
+
+    # Parser of single document: model's parse_obj, or parse_obj_as for Union, see parse_document().
+    _parse_obj: Callable[[dict], T]
+
+    # Field names and aliases of the model to construct it without validation, see _construct().
+    _construct_fields: List[Tuple[str, str]]
+
+    # Root model to validate list of documents of Union collection at once, None for single model,
+    # see parse_documents().
+    _documents_model: Optional[Type[BaseModel]]
+
+    # Models, instances of which hold bound collection (MotycModel), see _complete_model().
+    _bound_models: frozenset
+
+    # Models without aliased, excluded or included fields and own .dict(), instances of which
+    # can be copied to document as is, see _build_document().
+    _plain_models: frozenset
+
     # ----------------------------------------------------
     # Main API
 
@@ -35,7 +86,8 @@ class Collection(Generic[T]):
             name: Optional[str] = None,
             identity: str = '_id',
             indexes: Iterable[Union[str, IndexModel]] = (),
-            id_generator: Callable = lambda: str(uuid4())
+            id_generator: Callable = lambda: str(ObjectId()),
+            trust_db: bool = False
     ):
         """ Initializes Collection instance.
 
@@ -55,11 +107,18 @@ class Collection(Generic[T]):
             indexes should be re-recreated manually by calling Collection.create_indexes().
 
         :param id_generator: Callable to generate ids for non-default identity management (see save()).
+            Default is str representation of new ObjectId, which is monotonic, so keeps identity index compact.
+
+        :param trust_db: Should documents in the collection be trusted to match the model,
+            so they are parsed without validation by default (see parse_document()).
+            Applicable only to collections of flat models, which are written by PyMotyc.
         """
         self.name = name
         self.identity = identity
+        self._identity_is_default = identity == '_id'
         self.indexes = indexes
         self.id_generator = id_generator
+        self.trust_db = trust_db
 
     async def save(
             self, item: T, *,
@@ -71,6 +130,8 @@ class Collection(Generic[T]):
     ) -> T:
         """ Saves, inserts or updates model instance to the collection.
 
+        To write many instances at once use save_many(), which sends them with single request.
+
         :param item: Model instance to save.
 
         :param mode: Save mode, should be one of:
@@ -131,59 +192,78 @@ class Collection(Generic[T]):
 
         :return: Model instance after saving, including id generated or injected.
         """
-        document = item.dict(by_alias=True)
+        document = self._build_document(item)
 
-        if self.identity != '_id':
+        if not self._identity_is_default:
             assert '_id' not in document, "Should not have _id in the instance if collection's identity is non default."
 
         if _id is not None:
-            assert self.identity == '_id', "_id parameter can be provided only if collection's identity is default."
+            assert self._identity_is_default, "_id parameter can be provided only if collection's identity is default."
             assert '_id' not in document, "_id should be provided ether in instance or by _id param."
-            document['_id'] = ObjectId(_id)
+            document['_id'] = _id if isinstance(_id, ObjectId) else ObjectId(_id)
 
-        if mode == 'save':
-            if document.get(self.identity) is None:  # === New document.
-                if self.identity == '_id':
-                    if '_id' in document: del document['_id']
-                else:
-                    document[self.identity] = self.generate_id()
+        save_mode = self._save_modes.get(mode)
+        assert save_mode is not None, f"Mode {mode} is not supported."
+        await save_mode(self, document)
 
-                result: InsertOneResult = await self.collection.insert_one(document)  # will fail if exists due to index=unique violation for identity
-                document['_id'] = result.inserted_id  # will be removed while back-parsing if not necessary
-                document['__created__'] = True
+        return self.parse_document(document, inject_default_id=inject_default_id, inject_created=inject_created)
 
-            else:  # == Possibly an existing document that needs to be updated.
-                result: UpdateResult = await self.collection.update_one(
-                    {self.identity: document[self.identity]},
-                    {'$set': document}, upsert=True
-                )
-                if result.upserted_id is not None:
-                    document['_id'] = result.upserted_id
-                    document['__created__'] = True
-
-        elif mode == 'insert':
-            assert document.get(self.identity) is not None, f"Need identity ({self.identity}) for insert mode, use save mode to insert document without identity."
-            _result: InsertOneResult = await self.collection.insert_one(document)
-            document['__created__'] = True
+    async def save_many(
+            self, items: Iterable[T], *,
+            mode: Literal['save', 'insert', 'update'] = 'save',
+            inject_default_id: bool = False,
+            inject_created: bool = False
+    ) -> List[T]:
+        """ Saves, inserts or updates many model instances to the collection at once.
 
-        elif mode == 'update':
-            assert document.get(self.identity) is not None, f"Need identity ({self.identity}) for update mode."
-            mongo_query = {self.identity: document[self.identity]}
-            result: UpdateResult = await self.collection.update_one(
-                mongo_query,
-                {'$set': document}
-            )
-            if not result.matched_count: raise NotFound(mongo_query)
+        Works like save() for each instance, but all documents are sent to MongoDB
+        with single bulk request instead of one round-trip per instance.
 
-        else:
-            assert False, f"Mode {mode} is not supported."
+        :param items: Model instances to save.
 
-        return self.parse_document(document, inject_default_id=inject_default_id, inject_created=inject_created)
+        :param mode: Save mode, should be one of:
+            'save' (default):
+                Instances without identity are INSERTED, while identity is generated the same way as in save():
+                    - by database while inserting, if collection's identity is default ('_id'),
+                    - by callable provided during collection creation otherwise.
+                Instances with identity are UPSERTED based on identity field.
+
+            'insert':
+                All instances are INSERTED, identity must be provided.
+
+            'update':
+                All instances are UPDATED (overwritten as a whole), identity must be provided.
+                Raises NotFound if not all the documents found to update.
+
+            Documents are written unordered, so in case of error (i.e. pymongo.errors.BulkWriteError
+            on unique index violation) the rest of the documents are still written.
+
+        :param inject_default_id: Should _id field be injected into returned models
+            in case when no field with '_id' alias exists in the model.
+
+        :param inject_created: Should __created__ field be injected into returned models.
+
+        :return: Model instances after saving, including ids generated or injected, in the same order.
+        """
+        documents = [self._build_document(item) for item in items]
+        if not documents: return []
+
+        if not self._identity_is_default:
+            for document in documents:
+                assert '_id' not in document, "Should not have _id in the instance if collection's identity is non default."
+
+        save_many_mode = self._save_many_modes.get(mode)
+        assert save_many_mode is not None, f"Mode {mode} is not supported."
+        await save_many_mode(self, documents)
+
+        return self.parse_documents(documents, inject_default_id=inject_default_id, inject_created=inject_created)
 
     async def find_one(
             self, query: Union[dict, MotycQuery] = None, *,
             _id=None,
-            inject_default_id: bool = None
+            projection: dict = None,
+            inject_default_id: bool = None,
+            validate: bool = None
     ) -> T:
         """ Finds one element in the collection.
 
@@ -191,31 +271,40 @@ class Collection(Generic[T]):
 
         :param query: Raw MongoDB query, advanced query or MotycQuery (see MotycQuery.build_mongo_query)
         :param _id: Mongo's _id of the document to find, will be converted to ObjectId.
+        :param projection: MongoDB projection, by default only fields declared in the model(s) are retrieved.
         :param inject_default_id: Should _id field be injected into returned model.
+        :param validate: Should document be validated while parsing, see parse_document().
         :return: Item found parsed as Model.
         :raises: NotFound if nothing found.
         """
 
         mongo_query = self.build_mongo_query(query, _id=_id)
 
-        document = await self.collection.find_one(mongo_query)
+        if projection is None: projection = self.default_projection
+
+        document = await self.collection.find_one(mongo_query, projection)
 
         if document is None: raise NotFound(mongo_query)
-        return self.parse_document(document, inject_default_id=inject_default_id)
+        return self.parse_document(document, inject_default_id=inject_default_id, validate=validate)
 
     async def update_one(
             self, query: Union[dict, MotycQuery] = None,
             _id=None, *,
             update: Union[dict, MotycQuery],
+            projection: dict = None,
             inject_default_id=False
     ) -> T:
         """ Updates one element in the collection.
 
         Either query or Mongo's _id should be provided, the second only if collection's identity is default.
 
+        Update is done with single find_one_and_update request, which returns the document after update,
+        so there is no need in separate find_one() to get updated model.
+
         :param query: Raw MongoDB query, advanced query or MotycQuery (see MotycQuery.build_mongo_query)
         :param update: Raw MongoDB update query, advanced query or MotycQuery (see MotycQuery.build_mongo_query)
         :param _id: Mongo's _id of the document to update, will be converted to ObjectId.
+        :param projection: MongoDB projection, by default only fields declared in the model(s) are retrieved.
         :param inject_default_id: Should _id field be injected into returned model.
         :return: Updated model instance.
         :raises: NotFound if nothing found.
@@ -223,10 +312,12 @@ class Collection(Generic[T]):
 
         mongo_query = self.build_mongo_query(query, _id=_id)
         update_query = self.build_mongo_query(update)
+        if projection is None: projection = self.default_projection
 
         document = await self.collection.find_one_and_update(
             mongo_query,
             update_query,
+            projection,
             return_document=ReturnDocument.AFTER
         )
 
@@ -253,12 +344,13 @@ class Collection(Generic[T]):
 
         assert isinstance(item, BaseModel), "Can only handle BaseModel, not dict i.g."
 
-        document = item.dict(by_alias=True)
+        document = self._build_document(item)
 
-        assert document.get(self.identity) is not None, f"Need identity ({self.identity}) to update model."
+        identity = self.identity
+        assert document.get(identity) is not None, f"Need identity ({identity}) to update model."
 
         return await self.update_one(
-            {self.identity: document[self.identity]},
+            {identity: document[identity]},
             update,
             inject_default_id=inject_default_id
         )
@@ -288,13 +380,14 @@ class Collection(Generic[T]):
         """
 
         assert isinstance(item, BaseModel), "Can only handle BaseModel, not dict i.g."
-        document = item.dict(by_alias=True)
+        document = self._build_document(item)
 
-        assert document.get(self.identity) is not None, f"Need identity ({self.identity}) to detach model."
+        identity = self.identity
+        assert document.get(identity) is not None, f"Need identity ({identity}) to detach model."
 
-        await self.delete_one({self.identity: document[self.identity]})
+        await self.delete_one({identity: document[identity]})
 
-        document[self.identity] = None
+        document[identity] = None
 
         return self.parse_document(document)
 
@@ -304,7 +397,10 @@ class Collection(Generic[T]):
             skip: int = None,
             limit: int = None,
             limit_by: int = None,
+            batch_size: int = None,
+            projection: dict = None,
             inject_default_id: bool = None,
+            validate: bool = None,
     ) -> List[T]:
         """ Finds many elements in the collection.
         :param query: Raw MongoDB db query, where MotycFields can be used as keys, or MotycQuery, built with query builder.
@@ -312,56 +408,201 @@ class Collection(Generic[T]):
         :param skip: Number of documents to skip in db.
         :param limit: Number of documents to limit by db engine.
         :param limit_by: Maximum number of documents to retrieve on None for no limit.
+        :param batch_size: Number of documents to return by db engine in each batch of the cursor,
+            None for MongoDB default (101 documents in first batch, up to 16MB in subsequent ones).
+            Set it to expected result size to retrieve documents with fewer round-trips.
+        :param projection: MongoDB projection, by default only fields declared in the model(s) are retrieved.
         :param inject_default_id: Should _id field be injected into returned models.
+        :param validate: Should documents be validated while parsing, see parse_document().
         :return: List of documents, parsed as Models.
         """
 
         # todo: raw cursor as parameter
 
-        mongo_query = self.build_mongo_query(query) if query else {}
+        # limit 0 means no limit for db engine, so nothing is requested for limit_by 0.
+        if limit_by == 0: return []
+        # limit_by is applied by db engine as well, so no documents to be discarded are retrieved.
+        if limit_by is not None: limit = min(limit, limit_by) if limit else limit_by
+        if projection is None: projection = self.default_projection
 
-        cursor: AgnosticCursor = self.collection.find(mongo_query)
+        cursor = self.build_cursor(query, sort=sort, skip=skip, limit=limit, batch_size=batch_size, projection=projection)
 
-        if sort is not None:
-            cursor = cursor.sort([(k, v) for k, v in self.build_mongo_query(sort).items()])
+        # Documents are fetched by Motor batch by batch, not one by one, and then parsed, see parse_documents().
+        documents = await cursor.to_list(length=limit_by)
 
-        if skip is not None:
-            cursor = cursor.skip(skip)
+        return self.parse_documents(documents, inject_default_id=inject_default_id, validate=validate)
 
-        if limit is not None:
-            cursor = cursor.limit(limit)
+    async def find_with_ids(
+            self, query: Union[dict, MotycQuery] = None, *,
+            sort: dict = None,
+            skip: int = None,
+            limit: int = None,
+            batch_size: int = None,
+            projection: dict = None,
+            validate: bool = None,
+    ) -> List[Tuple[str, T]]:
+        """ Finds many elements in the collection together with Mongo's _id of their documents.
+
+        Useful for detached identity, when _id is not a part of the model, to get ids in str representation
+        directly from retrieved documents instead of injecting them into models with inject_default_id.
+
+        :param query: Raw MongoDB db query, where MotycFields can be used as keys, or MotycQuery, built with query builder.
+        :param sort: Ordered dict where keys are field names or MotycField, values are MongoDB sort options.
+        :param skip: Number of documents to skip in db.
+        :param limit: Number of documents to limit by db engine.
+        :param batch_size: Number of documents to return by db engine in each batch of the cursor.
+        :param projection: MongoDB projection, by default only fields declared in the model(s) are retrieved.
+            _id can not be excluded.
+        :param validate: Should documents be validated while parsing, see parse_document().
+        :return: List of tuples of document's _id, converted to str, and document, parsed as Model.
+        """
+
+        if projection is not None: assert projection.get('_id', 1), "_id can not be excluded by projection, it is returned with documents."
+        if projection is None: projection = self.default_projection
+
+        cursor = self.build_cursor(query, sort=sort, skip=skip, limit=limit, batch_size=batch_size, projection=projection)
+
+        documents = await cursor.to_list(length=None)
+        models = self.parse_documents(documents, validate=validate)
+
+        return [(str(document['_id']), model) for document, model in zip(documents, models)]
+
+    async def find_columns(
+            self, query: Union[dict, MotycQuery] = None, *,
+            fields: Iterable[Union[str, MotycField]],
+            sort: dict = None,
+            skip: int = None,
+            limit: int = None,
+            batch_size: int = None,
+    ) -> Dict[str, list]:
+        """ Finds many elements in the collection and returns values of given fields column by column.
+
+        Documents are not parsed to models, only requested fields are retrieved from MongoDB
+        and their raw values are collected into lists, which is useful for aggregation or export
+        of many documents, when model instances are not needed.
+
+        :param query: Raw MongoDB db query, where MotycFields can be used as keys, or MotycQuery, built with query builder.
+        :param fields: Field names (dot separated for nested fields) or MotycFields to retrieve.
+        :param sort: Ordered dict where keys are field names or MotycField, values are MongoDB sort options.
+        :param skip: Number of documents to skip in db.
+        :param limit: Number of documents to limit by db engine.
+        :param batch_size: Number of documents to return by db engine in each batch of the cursor.
+        :return: Dict of field name to list of field values, None for documents missing the field.
+        """
+        aliases = [field.alias if isinstance(field, MotycField) else field for field in fields]
+        paths = [alias.split('.') for alias in aliases]
+        columns = [[] for _ in aliases]
+
+        cursor = self.build_cursor(
+            query, sort=sort, skip=skip, limit=limit, batch_size=batch_size,
+            projection={alias: 1 for alias in aliases}
+        )
 
-        result = []
         async for document in cursor:
-            if limit_by is not None and len(result) >= limit_by: break
-            result.append(self.parse_document(document, inject_default_id=inject_default_id))
-        return result
+            for path, column in zip(paths, columns):
+                value = document
+                for key in path:
+                    value = value.get(key) if isinstance(value, dict) else None
+                column.append(value)
+
+        return dict(zip(aliases, columns))
+
+    async def iter(
+            self, query: Union[dict, MotycQuery] = None, *,
+            sort: dict = None,
+            skip: int = None,
+            limit: int = None,
+            batch_size: int = 100,
+            projection: dict = None,
+            inject_default_id: bool = None,
+            validate: bool = None,
+    ) -> AsyncIterator[T]:
+        """ Iterates over elements in the collection, retrieving documents batch by batch.
+
+        The next batch of documents is requested from MongoDB as soon as the current one
+        is received, so network round-trip for the next batch overlaps with parsing
+        and processing of the current one.
+
+        :param query: Raw MongoDB db query, where MotycFields can be used as keys, or MotycQuery, built with query builder.
+        :param sort: Ordered dict where keys are field names or MotycField, values are MongoDB sort options.
+        :param skip: Number of documents to skip in db.
+        :param limit: Number of documents to limit by db engine.
+        :param batch_size: Number of documents to retrieve in each batch, positive int.
+        :param projection: MongoDB projection, by default only fields declared in the model(s) are retrieved.
+        :param inject_default_id: Should _id field be injected into returned models.
+        :param validate: Should documents be validated while parsing, see parse_document().
+        :return: Async iterator of documents, parsed as Models.
+        """
+
+        # None would retrieve all documents at once and 0 none of them, as length of cursor.to_list().
+        assert isinstance(batch_size, int) and batch_size > 0, "batch_size should be positive int."
+        if projection is None: projection = self.default_projection
+
+        cursor = self.build_cursor(query, sort=sort, skip=skip, limit=limit, batch_size=batch_size, projection=projection)
+
+        next_batch = asyncio.ensure_future(cursor.to_list(length=batch_size))
+        try:
+            while True:
+                documents = await next_batch
+                if not documents: break
+                next_batch = asyncio.ensure_future(cursor.to_list(length=batch_size))
+                for model in self.parse_documents(documents, inject_default_id=inject_default_id, validate=validate):
+                    yield model
+        finally:
+            next_batch.cancel()
 
     # ----------------------------------------------------
     # Utility API to deal with raw collections
 
     async def create_indexes(self):
-        if self.identity != '_id':
-            await self.collection.create_index(self.identity, unique=True)
-
-        if self.indexes: await self.collection.create_indexes([
+        # All indexes are sent with single createIndexes command, so server builds them in one pass.
+        indexes = [
             i if isinstance(i, IndexModel) else IndexModel(i)
             for i in self.indexes
-        ])
+        ]
+        if not self._identity_is_default: indexes.insert(0, IndexModel(self.identity, unique=True))
+
+        if indexes: await self.collection.create_indexes(indexes)
 
     def generate_id(self):
         # todo config in engine
-        assert self.identity != '_id', 'Supported only for non default id field'
+        assert not self._identity_is_default, 'Supported only for non default id field'
         return self.id_generator()
 
+    def build_cursor(
+            self, query: Union[dict, MotycQuery] = None, *,
+            sort: dict = None,
+            skip: int = None,
+            limit: int = None,
+            batch_size: int = None,
+            projection: dict = None,
+    ) -> AgnosticCursor:
+        mongo_query = self.build_mongo_query(query) if query else {}
+
+        cursor: AgnosticCursor = self.collection.find(mongo_query, projection)
+
+        if sort is not None:
+            cursor = cursor.sort([(k, v) for k, v in self.build_mongo_query(sort).items()])
+
+        if skip is not None:
+            cursor = cursor.skip(skip)
+
+        if limit is not None:
+            cursor = cursor.limit(limit)
+
+        if batch_size is not None:
+            cursor = cursor.batch_size(batch_size)
+
+        return cursor
+
     def build_mongo_query(self, query: Union[dict, MotycQuery], *, _id=None):
         if query is not None:
             assert _id is None, "Either query or _id should be provided."
             return MotycQuery.build_mongo_query(query)
         else:
             assert _id is not None, "Either query or _id should be provided."
-            assert self.identity == '_id', "_id parameter can be used only if collection's identity is default"
-            return {'_id': ObjectId(_id)}
+            assert self._identity_is_default, "_id parameter can be used only if collection's identity is default"
+            return {'_id': _id if isinstance(_id, ObjectId) else ObjectId(_id)}
 
     # ----------------------------------------------------
 
@@ -374,21 +615,206 @@ class Collection(Generic[T]):
         models = Collection._check_type_get_basemodels(t)
 
         self.t = t
+        self._is_union = get_origin(t) in _union_origins
+        self._parse_obj = partial(parse_obj_as, t) if self._is_union else t.parse_obj
+        self._construct_fields = [] if self._is_union else [(name, field.alias) for name, field in t.__fields__.items()]
+        # Same as parse_obj_as(List[t]) does, but built once instead of being looked up on every call.
+        self._documents_model = create_model(
+            f'ParsingModel[{display_as_type(List[t])}]', __root__=(List[t], ...)
+        ) if self._is_union else None
         self.db = db
         if self.name is None: self.name = name
         self.collection = getattr(db, self.name)
 
+        self.default_projection = None if any(
+            model.__config__.extra == Extra.allow or
+            model.__pre_root_validators__ or
+            any(field.pre_validators for field in model.__fields__.values())
+            for model in models
+        ) else {
+            field.alias: 1
+            for model in models
+            for field in model.__fields__.values()
+        }
+
+        self._bound_models = frozenset(model for model in models if hasattr(model, '_bound_collection'))
+        # Field level exclude / include exist since Pydantic 1.9, such fields are filtered by .dict() only,
+        # as well as fields filtered by models overriding .dict() itself.
+        self._plain_models = frozenset(
+            model for model in models
+            if model.dict is BaseModel.dict and all(
+                field.alias == name and
+                getattr(field.field_info, 'exclude', None) is None and
+                getattr(field.field_info, 'include', None) is None
+                for name, field in model.__fields__.items()
+            )
+        )
+
         if inject_motyc_fields:
             for model in models: MotycField._inject_for_model(model)
 
-    def parse_document(self, document: dict, *, inject_default_id=False, inject_created=False) -> T:
-        if self.identity != '_id': assert not inject_default_id, "inject_default_id is not supported with non default identity management."
-        model = parse_obj_as(cast(Type[T], self.t), document)
+    def parse_document(self, document: dict, *, inject_default_id=False, inject_created=False, validate=None) -> T:
+        """ Parses MongoDB document to model instance.
+
+        :param document: Document retrieved from the collection.
+        :param inject_default_id: Should _id field be injected into returned model.
+        :param inject_created: Should __created__ field be injected into returned model.
+        :param validate: Should document be validated by Pydantic, None for collection's default (see trust_db).
+            If False, model is constructed without validation with Model.construct(), which is much faster,
+            but values are taken as is, i.e. nested models are left as dicts. So it is applicable
+            only to trusted documents of flat models. Ignored for collections typed with Union.
+        :return: Model instance.
+        """
+        if not self._identity_is_default: assert not inject_default_id, "inject_default_id is not supported with non default identity management."
+        if validate is None: validate = not self.trust_db
+        if validate or self._is_union:
+            model = self._parse_obj(document)
+        else:
+            model = self._construct(document)
+        return self._complete_model(model, document, inject_default_id=inject_default_id, inject_created=inject_created)
+
+    def parse_documents(self, documents: List[dict], *, inject_default_id=False, inject_created=False, validate=None) -> List[T]:
+        """ Parses list of MongoDB documents to model instances.
+
+        Documents of Union collections are validated for the whole list with single Pydantic call,
+        which is cheaper than parse_obj_as() for documents one by one. Documents of single model
+        collections are validated one by one with Model.parse_obj(), which is cheaper still.
+
+        :param documents: Documents retrieved from the collection.
+        :param inject_default_id: Should _id field be injected into returned models.
+        :param inject_created: Should __created__ field be injected into returned models.
+        :param validate: Should documents be validated by Pydantic, see parse_document().
+        :return: List of model instances.
+        """
+        if not self._identity_is_default: assert not inject_default_id, "inject_default_id is not supported with non default identity management."
+        if validate is None: validate = not self.trust_db
+        if self._is_union:
+            models = self._documents_model(__root__=documents).__root__
+        elif validate:
+            models = [self._parse_obj(document) for document in documents]
+        else:
+            models = [self._construct(document) for document in documents]
+        if not (inject_default_id or inject_created or self._bound_models): return models
+        return [
+            self._complete_model(model, document, inject_default_id=inject_default_id, inject_created=inject_created)
+            for model, document in zip(models, documents)
+        ]
+
+    def _complete_model(self, model: T, document: dict, *, inject_default_id=False, inject_created=False) -> T:
         if inject_default_id: object.__setattr__(model, '_id', document.get('_id', None))
         if inject_created: object.__setattr__(model, '__created__', document.get('__created__', False))
-        if hasattr(model, '_bound_collection'): model._bound_collection = self
+        if type(model) in self._bound_models: object.__setattr__(model, '_bound_collection', self)
         return model
 
+    def _build_document(self, item: T) -> dict:
+        # Shallow copy of instance's __dict__ is the same as item.dict(by_alias=True)
+        # while there are no aliases and no nested models or containers to convert.
+        if type(item) in self._plain_models:
+            document = dict(item.__dict__)
+            if not any(isinstance(value, _dict_converted_types) for value in document.values()): return document
+        return item.dict(by_alias=True)
+
+    def _construct(self, document: dict) -> T:
+        return self.t.construct(**{
+            name: document[alias]
+            for name, alias in self._construct_fields
+            if alias in document
+        })
+
+    async def _save_upsert(self, document: dict):
+        identity = self.identity
+
+        if document.get(identity) is None:  # === New document.
+            if self._identity_is_default:
+                if '_id' in document: del document['_id']
+            else:
+                document[identity] = self.generate_id()
+
+            result: InsertOneResult = await self.collection.insert_one(document)  # will fail if exists due to index=unique violation for identity
+            document['_id'] = result.inserted_id  # will be removed while back-parsing if not necessary
+            document['__created__'] = True
+
+        else:  # == Possibly an existing document that needs to be updated.
+            result: UpdateResult = await self.collection.update_one(
+                {identity: document[identity]},
+                {'$set': document}, upsert=True
+            )
+            if result.upserted_id is not None:
+                document['_id'] = result.upserted_id
+                document['__created__'] = True
+
+    async def _save_insert(self, document: dict):
+        identity = self.identity
+        assert document.get(identity) is not None, f"Need identity ({identity}) for insert mode, use save mode to insert document without identity."
+        _result: InsertOneResult = await self.collection.insert_one(document)
+        document['__created__'] = True
+
+    async def _save_update(self, document: dict):
+        identity = self.identity
+        assert document.get(identity) is not None, f"Need identity ({identity}) for update mode."
+        mongo_query = {identity: document[identity]}
+        result: UpdateResult = await self.collection.update_one(
+            mongo_query,
+            {'$set': document}
+        )
+        if not result.matched_count: raise NotFound(mongo_query)
+
+    # Save mode to implementation, see save().
+    _save_modes = {
+        'save': _save_upsert,
+        'insert': _save_insert,
+        'update': _save_update,
+    }
+
+    async def _save_many_upsert(self, documents: List[dict]):
+        identity = self.identity
+
+        created = [document.get(identity) is None for document in documents]
+        requests = []
+        for document, new in zip(documents, created):
+            if new:
+                # Ids are generated here for default identity too, like pymongo does for inserts,
+                # so they are known after the bulk write.
+                document[identity] = ObjectId() if self._identity_is_default else self.generate_id()
+                requests.append(InsertOne(document))
+            else:
+                requests.append(UpdateOne({identity: document[identity]}, {'$set': document}, upsert=True))
+
+        result: BulkWriteResult = await self.collection.bulk_write(requests, ordered=False)
+
+        for index, upserted_id in result.upserted_ids.items():
+            documents[index]['_id'] = upserted_id  # will be removed while back-parsing if not necessary
+            created[index] = True
+
+        for document, new in zip(documents, created): document['__created__'] = new
+
+    async def _save_many_insert(self, documents: List[dict]):
+        identity = self.identity
+        for document in documents:
+            assert document.get(identity) is not None, f"Need identity ({identity}) for insert mode, use save mode to insert documents without identity."
+
+        await self.collection.insert_many(documents, ordered=False)
+        for document in documents: document['__created__'] = True
+
+    async def _save_many_update(self, documents: List[dict]):
+        identity = self.identity
+        for document in documents:
+            assert document.get(identity) is not None, f"Need identity ({identity}) for update mode."
+
+        result: BulkWriteResult = await self.collection.bulk_write([
+            UpdateOne({identity: document[identity]}, {'$set': document})
+            for document in documents
+        ], ordered=False)
+        if result.matched_count < len(documents):
+            raise NotFound({identity: {'$in': [document[identity] for document in documents]}})
+
+    # Save mode to implementation, see save_many().
+    _save_many_modes = {
+        'save': _save_many_upsert,
+        'insert': _save_many_insert,
+        'update': _save_many_update,
+    }
+
     # ----------------------------------------------------
 
     @staticmethod
@@ -399,8 +825,8 @@ class Collection(Generic[T]):
         :raise: TypeError if collection type is improper.
         """
         result = []
-        if typing_inspect.is_union_type(t):
-            for tt in typing_inspect.get_args(t):
+        if get_origin(t) in _union_origins:
+            for tt in get_args(t):
                 if not issubclass(tt, BaseModel):
                     raise TypeError(f"Args of Union must be BaseModels, {t} not.")
                 result.append(tt)
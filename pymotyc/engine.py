@@ -1,13 +1,68 @@
+import asyncio
+from functools import lru_cache
 from typing import Optional, List, Sequence, Union, Iterable
 
 from motor.motor_asyncio import AsyncIOMotorClient
 from typing_extensions import Literal
 
+try:
+    from pymongo import AsyncMongoClient
+except ImportError:  # PyMongo < 4.9 has no native asyncio client.
+    AsyncMongoClient = None
+
 from pymotyc.util import get_annotations, camel_to_snake
 
 
+def get_client(
+        uri: str, *,
+        driver: Literal['motor', 'pymongo'] = 'motor',
+        max_pool_size: Optional[int] = None,
+        min_pool_size: Optional[int] = None,
+) -> Union[AsyncIOMotorClient, 'AsyncMongoClient']:
+    """ Returns Motor (or PyMongo's native asyncio) client for given MongoDB uri.
+
+    Motor client creation (connection pool setup, topology discovery) is done once per uri and options,
+    subsequent calls return the same instance, so it is safe to call on every application
+    startup or reload. Please note, Motor client is bound to the event loop it is first used in.
+
+    PyMongo's native asyncio client is tied to the event loop it runs on as well, but it is created
+    on every call, so each event loop (i.e. asyncio.run() per test) gets its own client.
+
+    Throughput of Motor is sensitive to the size of the connection pool and of the thread pool,
+    Motor runs PyMongo operations in. The latter is set by MOTOR_MAX_WORKERS environment variable
+    (default is 5 x CPU count), which is read once on Motor import, so it should be set in
+    the environment of the process, not in the code.
+
+    :param uri: MongoDB connection string.
+    :param driver: 'motor' for Motor client, 'pymongo' for PyMongo's native asyncio client (PyMongo>=4.9),
+        which runs operations on the event loop without Motor's thread pool, so MOTOR_MAX_WORKERS does not apply.
+    :param max_pool_size: Maximum number of connections in the pool, None for PyMongo default (100).
+    :param min_pool_size: Minimum number of connections kept in the pool, None for PyMongo default (0).
+    :return: Client instance.
+    :raise: ImportError if PyMongo's native asyncio client is requested, but not available.
+    """
+    if driver == 'pymongo':
+        if AsyncMongoClient is None: raise ImportError("PyMongo>=4.9 is required for native asyncio client.")
+        return AsyncMongoClient(uri, **_pool_options(max_pool_size, min_pool_size))
+
+    assert driver == 'motor', f"Driver {driver} is not supported."
+    return _get_motor_client(uri, max_pool_size, min_pool_size)
+
+
+@lru_cache(maxsize=8)
+def _get_motor_client(uri: str, max_pool_size: Optional[int], min_pool_size: Optional[int]) -> AsyncIOMotorClient:
+    return AsyncIOMotorClient(uri, **_pool_options(max_pool_size, min_pool_size))
+
+
+def _pool_options(max_pool_size: Optional[int], min_pool_size: Optional[int]) -> dict:
+    options = {}
+    if max_pool_size is not None: options['maxPoolSize'] = max_pool_size
+    if min_pool_size is not None: options['minPoolSize'] = min_pool_size
+    return options
+
+
 class Engine:
-    motor: AsyncIOMotorClient
+    motor: Union[AsyncIOMotorClient, 'AsyncMongoClient']
     databases: List[type]
 
     def __init__(self):
@@ -15,7 +70,7 @@ class Engine:
 
     async def bind(
             self, *,
-            motor: AsyncIOMotorClient,
+            motor: Union[AsyncIOMotorClient, 'AsyncMongoClient'],
             databases: Iterable = (),
             already_bound: Literal['skip', 'assert'] = 'assert',
             inject_motyc_fields=False,
@@ -24,6 +79,8 @@ class Engine:
         See _bind_database for details.
         :param databases: Databases to bind, alternatively one can use Engine.database decorator.
         :param motor: Motor instance to bind to.
+            PyMongo's native asyncio client (pymongo.AsyncMongoClient, PyMongo>=4.9) can be used instead,
+            it has the same API, but runs operations on the event loop without Motor's thread pool.
         :param already_bound: What to do, if database already bound.
         :param inject_motyc_fields: Inject MotycFields to all involved Pydantic models,
             to fields be accessible via Model.<field_name> to be used in advanced queries.
@@ -85,7 +142,8 @@ class Engine:
             # first check is annotation is GenericAlias
             # https://stackoverflow.com/questions/49171189/whats-the-correct-way-to-check-if-an-object-is-a-typing-generic
 
-            if issubclass(getattr(annotation, '__origin__', None), Collection):
+            origin = getattr(annotation, '__origin__', None)
+            if isinstance(origin, type) and issubclass(origin, Collection):
                 return annotation.__args__[0]
 
             # then check annotation is not Collection without []
@@ -95,12 +153,27 @@ class Engine:
             # we don't care all other cases
             return None
 
+        # Database name is resolved once and cached in the class itself, the same way annotations are.
+        db_name = db.__dict__.get('__pymotyc__db_name__')
+        if db_name is None:
+            db_name = getattr(db, '__db__name__', None)
+            if db_name is None: db_name = camel_to_snake(db.__name__)
+            setattr(db, '__pymotyc__db_name__', db_name)
+        motor_db = getattr(self.motor, db_name)
+
         annotations = get_annotations(db)
-        attributes = dir(db)
-        for attr_name in {*annotations, *attributes}:
+
+        # Attributes declared in the class and it's bases, without members of object dir(db) would give.
+        attributes = {}
+        for base in reversed(db.__mro__):
+            if base is not object: attributes.update(vars(base))
+
+        # Collections to bind with their types and attribute names, bound only after all attributes are checked.
+        to_bind = []
+        for attr_name in annotations.keys() | attributes.keys():
             t = check_annotation(annotations[attr_name]) if attr_name in annotations else None
             if attr_name in attributes:
-                attr = getattr(db, attr_name)
+                attr = attributes[attr_name]
                 if not isinstance(attr, Collection):
                     # ignore, but check annotation is not Collection first
                     assert t is None, f"Do not use Collection[] annotation for non Collection() attribute {attr_name}."
@@ -115,7 +188,10 @@ class Engine:
 
             collection: Collection = getattr(db, attr_name)
 
-            db_name = getattr(db, '__db__name__', None)
-            if db_name is None: db_name = camel_to_snake(db.__name__)
+            to_bind.append((collection, t, attr_name))
 
-            await collection._bind(self, getattr(self.motor, db_name), t, attr_name, **kwargs)
+        # Collections are independent of each other, so they are bound concurrently.
+        await asyncio.gather(*(
+            collection._bind(self, motor_db, t, attr_name, **kwargs)
+            for collection, t, attr_name in to_bind
+        ))
@@ -1,4 +1,5 @@
-from typing import TypeVar
+import asyncio
+from typing import TypeVar, Optional, Iterable, List, Dict
 
 from bson import ObjectId
 from pydantic import BaseModel, Field
@@ -19,12 +20,37 @@ class MotycModel(BaseModel):
         assert self._bound_collection is not None, "No bound collection found, use Database.collection.save() first."
         return await self._bound_collection.save(self, mode='update')
 
+    @classmethod
+    async def save_many(cls, models: Iterable[T], *, mode: str = 'update') -> List[T]:
+        """ Saves many models at once, with single bulk request per bound collection.
+
+        :param models: Model instances, retrieved from or saved to the collections before.
+        :param mode: Save mode, see Collection.save_many().
+        :return: Model instances after saving, in the same order.
+        """
+        models = list(models)
+
+        indexes_by_collection: Dict[Collection, List[int]] = {}
+        for index, model in enumerate(models):
+            assert model._bound_collection is not None, "No bound collection found, use Database.collection.save() first."
+            indexes_by_collection.setdefault(model._bound_collection, []).append(index)
+
+        saved = await asyncio.gather(*(
+            collection.save_many([models[index] for index in indexes], mode=mode)
+            for collection, indexes in indexes_by_collection.items()
+        ))
+
+        result = [None] * len(models)
+        for indexes, saved_models in zip(indexes_by_collection.values(), saved):
+            for index, model in zip(indexes, saved_models): result[index] = model
+        return result
+
 
 class WithId(BaseModel):
     class Config:
         arbitrary_types_allowed = True
         json_encoders = {
-            ObjectId: lambda oid: str(oid),
+            ObjectId: str,
         }
 
     # Unfortunately, there is no way to name Pydantic model field as '_id', so alias to be used
@@ -37,3 +63,15 @@ class WithId(BaseModel):
 class WithInjected(BaseModel):
     def __init_subclass__(cls, **kwargs):
         MotycField._inject_for_model(cls)
+
+
+def id_of(model: BaseModel) -> Optional[ObjectId]:
+    """ Returns Mongo's _id, injected into model instance with inject_default_id option.
+
+    Reads instance's __dict__ directly, without attribute lookup and exception
+    handling of hasattr() / getattr(), so it is cheap to call for every model in a list.
+
+    :param model: Model instance, retrieved or saved with inject_default_id=True.
+    :return: Injected _id or None if it was not injected.
+    """
+    return model.__dict__.get('_id')
@@ -1,6 +1,6 @@
+import re
 from abc import ABC, abstractmethod
-from copy import deepcopy
-from typing import Any, Mapping, cast, Type, Union
+from typing import Any, Mapping, cast, Type, Union, Callable
 
 from pydantic import BaseModel
 from pydantic.fields import ModelField
@@ -32,6 +32,10 @@ MongoQuery = dict
 # ====================================================
 
 class MotycQuery(ABC):
+    # Queries are built in large numbers, so all query classes declare slots instead of __dict__.
+    # _cached is compiled MongoDB query, see build_mongo_query().
+    __slots__ = ('_cached',)
+
     def __and__(self, other: 'MotycQuery'):
         return MotycQueryNode(self, '__and__', other)
 
@@ -62,33 +66,40 @@ class MotycQuery(ABC):
                     age: int
                 build_mongo_query((M(Employee.name)=="Vasya")&(M(Employee.age)>=42))
 
-        :return: Raw MongoDB query.
+        :return: Raw MongoDB query, new dict, but nested values may be shared with the query passed
+            or with other results for the same MotycQuery, so they must not be mutated.
         """
 
         if isinstance(query, MotycQuery):
-            return query.to_mongo_query()
+            # Query tree is not changed once built, so it is compiled only once and then reused.
+            compiled = getattr(query, '_cached', None)
+            if compiled is None: compiled = query._cached = query.to_mongo_query()
+            return dict(compiled)
 
         assert isinstance(query, dict)
 
-        query = deepcopy(query)
-
-        # todo immutably
-        def mod_requrs(query: Union[dict, Any]) -> dict:
-            if not isinstance(query, dict): return query
-            result = {}
-            for key, val in query.items():
-                if isinstance(key, MotycField):
-                    key = key.alias
-
-                if isinstance(val, list):
-                    val = [mod_requrs(item) for item in val]
-                elif isinstance(val, dict):
-                    val = mod_requrs(val)
-                elif isinstance(val, BaseModel):
-                    val = val.dict(by_alias=True)
-
-                result[key] = val
-            return result
+        # Flat queries, like {Employee.login: login} or sort {Employee.age: 1}, are built on every request,
+        # only keys need to be converted, no need in recursive traversal.
+        if not any(isinstance(val, (dict, list, BaseModel)) for val in query.values()):
+            return {key.alias if isinstance(key, MotycField) else key: val for key, val in query.items()}
+
+        # Models converted during this call by id(), same model used in several places is converted once.
+        # Models are referenced by the query itself while converting, so ids can not be reused.
+        converted_models = {}
+
+        # Dicts and lists are rebuilt while converting, so the query passed is never modified and needs no copy.
+        def mod_requrs(val: Any) -> Any:
+            if isinstance(val, dict):
+                return {
+                    key.alias if isinstance(key, MotycField) else key: mod_requrs(item)
+                    for key, item in val.items()
+                }
+            if isinstance(val, list): return [mod_requrs(item) for item in val]
+            if isinstance(val, BaseModel):
+                converted = converted_models.get(id(val))
+                if converted is None: converted = converted_models[id(val)] = val.dict(by_alias=True)
+                return converted
+            return val
 
         return mod_requrs(query)
 
@@ -96,6 +107,7 @@ class MotycQuery(ABC):
 # ====================================================
 
 class MotycQueryLeaf(MotycQuery, ABC):
+    __slots__ = ('motyc_field',)
 
     def __init__(self, motyc_field: 'MotycField'):
         self.motyc_field = motyc_field
@@ -104,23 +116,28 @@ class MotycQueryLeaf(MotycQuery, ABC):
 # ----------------------------------------------------
 
 class MotycQueryLeafCompare(MotycQueryLeaf):
+    __slots__ = ('op', 'literal', '_repr_op', '_mongo_op')
 
     def __init__(self, motyc_field: 'MotycField', op: CompareOp, literal: Any):
         super().__init__(motyc_field)
         self.op = op
         self.literal = literal
+        self._repr_op = compare_ops_repr[op]
+        self._mongo_op = compare_ops_mongo[op]
 
     def __str__(self):
-        return f"{self.motyc_field.alias}{compare_ops_repr[self.op]}{self.literal}"
+        return f"{self.motyc_field.alias}{self._repr_op}{self.literal}"
 
     def to_mongo_query(self) -> MongoQuery:
-        return {self.motyc_field.alias: {compare_ops_mongo[self.op]: self.literal}}
+        return {self.motyc_field.alias: {self._mongo_op: self.literal}}
 
 
 # ----------------------------------------------------
 
 
 class MotycQueryLeafRegex(MotycQueryLeaf):
+    __slots__ = ('pattern', 'options')
+
     def __init__(self, motyc_field: 'MotycField', pattern: str, options: str):
         super().__init__(motyc_field)
         self.pattern = pattern
@@ -136,24 +153,42 @@ class MotycQueryLeafRegex(MotycQueryLeaf):
 # ====================================================
 
 class MotycQueryNode(MotycQuery):
+    __slots__ = ('left', 'op', 'right', '_repr_op', '_mongo_op')
+
     def __init__(self, left: MotycQuery, op: LogicalOp, right: MotycQuery):
         self.left = left
         self.op = op
         self.right = right
+        self._repr_op = logical_ops_repr[op]
+        self._mongo_op = logical_ops_mongo[op]
 
     def __str__(self):
-        return f"({self.left} {logical_ops_repr[self.op]} {self.right})"
+        return f"({self.left} {self._repr_op} {self.right})"
 
     def to_mongo_query(self) -> MongoQuery:
-        return {logical_ops_mongo[self.op]: [self.left.to_mongo_query(), self.right.to_mongo_query()]}
+        # Chains like a & b & c are flattened to single {'$and': [a, b, c]} instead of nested ones.
+        return {self._mongo_op: [*self._operands(self.left), *self._operands(self.right)]}
+
+    def _operands(self, query: MotycQuery) -> list:
+        if isinstance(query, MotycQueryNode) and query.op == self.op: return query.to_mongo_query()[self._mongo_op]
+        return [query.to_mongo_query()]
 
 
 # ====================================================
 
 
 class MotycField:
+    __slots__ = ('model_field_or_alias', 'alias', '_hash', '_children')
+
     def __init__(self, model_field_or_alias: Union[ModelField, str]):
         self.model_field_or_alias = model_field_or_alias
+        # Resolved once, MotycFields are injected into model classes and reused by every query.
+        self.alias: str = (model_field_or_alias.alias
+                           if isinstance(model_field_or_alias, ModelField) else
+                           model_field_or_alias)
+        self._hash = hash(self.alias)
+        # Nested fields by attribute name, see __getattr__().
+        self._children = {}
 
     def __eq__(self, other):
         return MotycQueryLeafCompare(self, '__eq__', other)
@@ -174,27 +209,41 @@ class MotycField:
         return MotycQueryLeafCompare(self, '__ne__', other)
 
     def __getattr__(self, item):
-        if item.startswith('__'): raise AttributeError(item)
-        return MotycField(self.alias + '.' + item)
+        if item[:2] == '__': raise AttributeError(item)
+        child = self._children.get(item)
+        if child is None: child = self._children[item] = MotycField(self.alias + '.' + item)
+        return child
 
     def regex(self, pattern: str, options: str = ""):
         return MotycQueryLeafRegex(self, pattern, options)
 
+    def startswith(self, prefix: str):
+        # Anchored case-sensitive regex can use index on the field, unlike arbitrary one, which scans it all.
+        return MotycQueryLeafRegex(self, '^' + re.escape(prefix), "")
+
     def __hash__(self):
-        return hash(self.alias)
+        return self._hash
 
     @staticmethod
     def _inject_for_model(model: Type[BaseModel]):
-        field: ModelField
+        # All values of __fields__ are ModelFields, no need to check.
         for field_name, field in model.__fields__.items():
-            if isinstance(field, ModelField):
-                setattr(model, field_name, MotycField(field))
-
-    @property
-    def alias(self) -> str:
-        return (self.model_field_or_alias.alias
-                if isinstance(self.model_field_or_alias, ModelField) else
-                self.model_field_or_alias)
+            setattr(model, field_name, MotycField(field))
+
+
+def filter_by(motyc_field: Any) -> Callable[[Any], MongoQuery]:
+    """ Builds factory of equality MongoDB queries for the field, with field's alias resolved once.
+
+    Useful for queries, which are executed repeatedly, i.e. in REST API endpoints:
+        by_login = filter_by(Employee.login)
+        ...
+        employee = await Warehouse.employees.find_one(by_login(login))
+
+    :param motyc_field: MotycField (see MotycQuery.build_mongo_query) or field name.
+    :return: Callable, which returns MongoDB query for given field value.
+    """
+    alias = motyc_field.alias if isinstance(motyc_field, MotycField) else motyc_field
+    return lambda value: {alias: value}
 
 
 # noinspection PyPep8Naming
@@ -4,14 +4,22 @@ import re
 from typing import Dict, Any
 
 
+_camel_re = re.compile(r'(?<!^)(?=[A-Z])')
+
+
 def camel_to_snake(s):
-    return re.sub(r'(?<!^)(?=[A-Z])', '_', s).lower()
+    return _camel_re.sub('_', s).lower()
 
 
 def get_annotations(cls: type) -> Dict[str, Any]:
+    # Classes are not changed after definition, so annotations are merged once and cached in the class itself.
+    result = cls.__dict__.get('__pymotyc__annotations__')
+    if result is not None: return result
+
     result = {}
-    for cls in reversed(inspect.getmro(cls)):
-        result.update(getattr(cls, '__annotations__', {}))
+    for base in reversed(inspect.getmro(cls)):
+        result.update(getattr(base, '__annotations__', {}))
+    setattr(cls, '__pymotyc__annotations__', result)
     return result
 
 
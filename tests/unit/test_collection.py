@@ -1,10 +1,14 @@
 from typing import Union
 
 import pytest
-from pydantic import BaseModel
+from bson import ObjectId
+from pydantic import BaseModel, Field, root_validator
+from pymongo import InsertOne
 from typing_extensions import Literal
 
-from pymotyc import Collection, Engine
+from pymotyc import Collection, Engine, WithId
+from pymotyc.errors import NotFound
+from pymotyc.query import MotycField
 
 
 class Model(BaseModel):
@@ -17,10 +21,71 @@ class SomeDatabase:
     collection_bar: Collection[Model] = Collection(name='some_collection')
 
 
+class MockMotorCursor:
+    def __init__(self, documents):
+        self.documents = list(documents)
+
+    def batch_size(self, _batch_size):
+        return self
+
+    def limit(self, limit):
+        self.documents = self.documents[:limit]
+        return self
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self.documents: raise StopAsyncIteration
+        return self.documents.pop(0)
+
+    async def to_list(self, length):
+        result, self.documents = self.documents[:length], self.documents[length:]
+        return result
+
+
 class MockMotorCollection:
     def __init__(self, name, db: 'MockMotorDB'):
         self.name = name
         self.db = db
+        self.documents = []
+
+    def find(self, _query, _projection=None):
+        return MockMotorCursor(self.documents)
+
+    async def find_one(self, _query, projection=None):
+        return {key: value for key, value in self.documents[0].items() if projection is None or key in projection}
+
+    async def find_one_and_update(self, _query, _update, projection=None, **_kwargs):
+        return await self.find_one(_query, projection)
+
+    async def insert_many(self, documents, ordered=True):
+        self.documents += [dict(document) for document in documents]
+
+    async def bulk_write(self, requests, ordered=True):
+        # Supports only InsertOne and UpdateOne with single key filter and $set, as used by Collection.save_many().
+        result = MockBulkWriteResult()
+        for index, request in enumerate(requests):
+            if isinstance(request, InsertOne):
+                self.documents.append(dict(request._doc))
+                continue
+
+            (key, value), = request._filter.items()
+            existing = next((document for document in self.documents if document.get(key) == value), None)
+            if existing is not None:
+                existing.update(request._doc['$set'])
+                result.matched_count += 1
+            elif request._upsert:
+                document = {'_id': ObjectId(), **request._doc['$set']}
+                self.documents.append(document)
+                result.upserted_ids[index] = document['_id']
+        return result
+
+
+class MockBulkWriteResult:
+    def __init__(self):
+        self.matched_count = 0
+        self.upserted_ids = {}
 
 
 class MockMotorDB:
@@ -53,6 +118,33 @@ async def test_binding():
     assert c.db.name == 'some_database'
 
 
+class NonCollectionDatabase:
+    foo: Collection[Model]
+    bar: int
+    baz = 'baz'
+
+
+@pytest.mark.asyncio
+async def test_binding_ignores_non_collection_members():
+    await Engine().bind(motor=MockMotor(), databases=[NonCollectionDatabase])
+
+    assert NonCollectionDatabase.foo.collection.name == 'foo'
+    assert not hasattr(NonCollectionDatabase, 'bar')
+    assert NonCollectionDatabase.baz == 'baz'
+
+
+class NamedDatabase:
+    __db__name__ = 'named'
+    foo: Collection[Model]
+
+
+@pytest.mark.asyncio
+async def test_binding_database_name():
+    await Engine().bind(motor=MockMotor(), databases=[NamedDatabase])
+    assert NamedDatabase.foo.db.name == 'named'
+    assert NamedDatabase.__pymotyc__db_name__ == 'named'  # resolved once
+
+
 class Database:
     foo: Collection[Model]
 
@@ -65,6 +157,148 @@ async def test_parse_document():
     assert isinstance(model, Model)
     assert model == Model(foo=1, bar='baz')
 
+    model = Database.foo.parse_document({'_id': 'some_id', 'foo': 1, 'bar': 'baz'}, validate=False)
+    assert isinstance(model, Model)
+    assert model == Model(foo=1, bar='baz')
+
+    models = Database.foo.parse_documents([{'foo': 1, 'bar': 'baz'}, {'foo': 2, 'bar': 'qux'}])
+    assert models == [Model(foo=1, bar='baz'), Model(foo=2, bar='qux')]
+    assert Database.foo._documents_model is None
+
+
+class TrustedDatabase:
+    foo: Collection[Model] = Collection(trust_db=True)
+
+
+@pytest.mark.asyncio
+async def test_parse_trusted_document():
+    await Engine().bind(motor=MockMotor(), databases=[TrustedDatabase])
+
+    model = TrustedDatabase.foo.parse_document({'foo': '1', 'bar': 'baz'})
+    assert model.foo == '1'  # not validated, so not coerced to int
+
+
+class Other(BaseModel):
+    baz: int
+
+
+class UnionDatabase:
+    foo: Collection[Union[Model, Other]]
+
+
+@pytest.mark.asyncio
+async def test_parse_documents_of_union():
+    await Engine().bind(motor=MockMotor(), databases=[UnionDatabase])
+
+    models = UnionDatabase.foo.parse_documents([{'foo': 1, 'bar': 'baz'}, {'baz': 2}])
+    assert models == [Model(foo=1, bar='baz'), Other(baz=2)]
+    assert UnionDatabase.foo._documents_model is not None
+
+
+class IterDatabase:
+    foo: Collection[Model]
+
+
+@pytest.mark.asyncio
+async def test_iter():
+    await Engine().bind(motor=MockMotor(), databases=[IterDatabase])
+
+    IterDatabase.foo.collection.documents = [{'foo': i, 'bar': str(i)} for i in range(5)]
+
+    models = [model async for model in IterDatabase.foo.iter(batch_size=2)]
+    assert models == [Model(foo=i, bar=str(i)) for i in range(5)]
+
+    for batch_size in (None, 0):
+        with pytest.raises(AssertionError):
+            async for _ in IterDatabase.foo.iter(batch_size=batch_size): pass
+
+
+class FindDatabase:
+    foo: Collection[Model]
+
+
+@pytest.mark.asyncio
+async def test_find_limit_by():
+    await Engine().bind(motor=MockMotor(), databases=[FindDatabase])
+
+    FindDatabase.foo.collection.documents = [{'foo': i, 'bar': str(i)} for i in range(3)]
+
+    assert await FindDatabase.foo.find(limit_by=2) == [Model(foo=0, bar='0'), Model(foo=1, bar='1')]
+    assert await FindDatabase.foo.find(limit_by=0) == []
+
+
+class WithIdsDatabase:
+    foo: Collection[Model]
+
+
+@pytest.mark.asyncio
+async def test_find_with_ids():
+    await Engine().bind(motor=MockMotor(), databases=[WithIdsDatabase])
+
+    ids = [ObjectId() for _ in range(2)]
+    WithIdsDatabase.foo.collection.documents = [{'_id': _id, 'foo': i, 'bar': str(i)} for i, _id in enumerate(ids)]
+
+    assert await WithIdsDatabase.foo.find_with_ids() == [
+        (str(_id), Model(foo=i, bar=str(i))) for i, _id in enumerate(ids)
+    ]
+
+    with pytest.raises(AssertionError):
+        await WithIdsDatabase.foo.find_with_ids(projection={'_id': 0, 'foo': 1, 'bar': 1})
+
+
+class ColumnsDatabase:
+    foo: Collection[Model]
+
+
+@pytest.mark.asyncio
+async def test_find_columns():
+    await Engine().bind(motor=MockMotor(), databases=[ColumnsDatabase])
+
+    ColumnsDatabase.foo.collection.documents = [{'foo': 1, 'bar': {'baz': 'a'}}, {'foo': 2}]
+
+    assert await ColumnsDatabase.foo.find_columns(fields=['foo', 'bar.baz']) == {
+        'foo': [1, 2],
+        'bar.baz': ['a', None],
+    }
+
+
+class ProjectionDatabase:
+    foo: Collection[Model]
+
+
+@pytest.mark.asyncio
+async def test_default_projection():
+    await Engine().bind(motor=MockMotor(), databases=[ProjectionDatabase])
+
+    assert ProjectionDatabase.foo.default_projection == {'foo': 1, 'bar': 1}
+
+    ProjectionDatabase.foo.collection.documents = [{'foo': 1, 'bar': 'baz', 'ephemeral': 'qux'}]
+    assert await ProjectionDatabase.foo.find_one({}) == Model(foo=1, bar='baz')
+    assert await ProjectionDatabase.foo.update_one({}, update={}) == Model(foo=1, bar='baz')
+
+
+class Migrated(BaseModel):
+    full_name: str
+
+    @root_validator(pre=True)
+    def migrate_name(cls, values):
+        if 'name' in values: values.setdefault('full_name', values.pop('name'))
+        return values
+
+
+class MigratedDatabase:
+    foo: Collection[Migrated]
+
+
+@pytest.mark.asyncio
+async def test_no_default_projection_with_pre_validators():
+    await Engine().bind(motor=MockMotor(), databases=[MigratedDatabase])
+
+    assert MigratedDatabase.foo.default_projection is None
+
+    MigratedDatabase.foo.collection.documents = [{'name': 'Vasya'}]  # old versioned document
+    assert await MigratedDatabase.foo.find_one({}) == Migrated(full_name='Vasya')
+
 
 
 def test_check_type_get_basemodels():
@@ -85,3 +319,123 @@ def test_check_type_get_basemodels():
 
     with pytest.raises(TypeError):
         Collection._check_type_get_basemodels(int)
+
+
+def test_build_mongo_query():
+    class Foo(BaseModel):
+        foo: int
+
+    MotycField._inject_for_model(Foo)
+
+    collection = Collection()
+    assert collection.build_mongo_query({Foo.foo: 1, 'bar': 'baz'}) == {'foo': 1, 'bar': 'baz'}
+    assert collection.build_mongo_query({Foo.foo: {'$gt': 1}}) == {'foo': {'$gt': 1}}
+
+
+class DocumentDatabase:
+    foo: Collection[Model]
+
+
+class Secret(BaseModel):
+    name: str
+    password: str = Field('x', exclude=True)
+
+
+class Token(BaseModel):
+    name: str
+    token: str
+
+    def dict(self, **kwargs):
+        return super().dict(**{**kwargs, 'exclude': {'token'}})
+
+
+class SecretDatabase:
+    foo: Collection[Secret]
+    bar: Collection[Token]
+
+
+@pytest.mark.asyncio
+async def test_build_document():
+    await Engine().bind(motor=MockMotor(), databases=[DocumentDatabase, SecretDatabase])
+
+    class Nested(BaseModel):
+        model: Model
+
+    model = Model(foo=1, bar='baz')
+    document = DocumentDatabase.foo._build_document(model)
+    assert document == model.dict(by_alias=True)
+    assert document is not model.__dict__
+
+    nested = Nested(model=model)
+    assert DocumentDatabase.foo._build_document(nested) == {'model': {'foo': 1, 'bar': 'baz'}}
+
+    # Excluded fields are never copied to the document.
+    assert SecretDatabase.foo._build_document(Secret(name='a', password='p')) == {'name': 'a'}
+
+    # Overridden .dict() is always respected.
+    assert SecretDatabase.bar._build_document(Token(name='a', token='t')) == {'name': 'a'}
+
+
+class Employee(BaseModel):
+    employee_id: str = None
+    name: str
+
+
+class Document(WithId):
+    name: str
+
+
+class SaveManyDatabase:
+    employees: Collection[Employee] = Collection(identity='employee_id')
+    documents: Collection[Document]
+
+
+@pytest.mark.asyncio
+async def test_save_many():
+    await Engine().bind(motor=MockMotor(), databases=[SaveManyDatabase])
+    employees = SaveManyDatabase.employees
+
+    # New instances are inserted with generated identity.
+    vasya, frosya = await employees.save_many([Employee(name='Vasya'), Employee(name='Frosya')], inject_created=True)
+    assert vasya.employee_id and frosya.employee_id and vasya.employee_id != frosya.employee_id
+    assert vasya.__created__ and frosya.__created__
+
+    # Mixed batch: existing instance is updated, new ones are inserted or upserted.
+    vasya.name = 'Vasily'
+    vasily, dusya, petya = await employees.save_many([
+        vasya,
+        Employee(name='Dusya'),
+        Employee(employee_id='petya', name='Petya'),
+    ], inject_created=True)
+    assert (vasily.__created__, dusya.__created__, petya.__created__) == (False, True, True)
+    assert dusya.employee_id and petya.employee_id == 'petya'
+    assert sorted(document['name'] for document in employees.collection.documents) == \
+           ['Dusya', 'Frosya', 'Petya', 'Vasily']
+
+    # Mongo's _id is generated by client for default identity.
+    document, = await SaveManyDatabase.documents.save_many([Document(name='doc')])
+    assert isinstance(document.id, ObjectId)
+    assert SaveManyDatabase.documents.collection.documents == [{'_id': document.id, 'name': 'doc'}]
+
+
+@pytest.mark.asyncio
+async def test_save_many_insert_and_update():
+    await Engine().bind(motor=MockMotor(), databases=[SaveManyDatabase], already_bound='skip')
+    employees = SaveManyDatabase.employees
+    employees.collection.documents = []
+
+    vasya, = await employees.save_many([Employee(employee_id='vasya', name='Vasya')], mode='insert', inject_created=True)
+    assert vasya.__created__
+
+    with pytest.raises(AssertionError):
+        await employees.save_many([Employee(name='Frosya')], mode='insert')
+
+    vasily, = await employees.save_many([Employee(employee_id='vasya', name='Vasily')], mode='update')
+    assert vasily == Employee(employee_id='vasya', name='Vasily')
+    assert employees.collection.documents == [{'employee_id': 'vasya', 'name': 'Vasily'}]
+
+    with pytest.raises(NotFound):
+        await employees.save_many([Employee(employee_id='petya', name='Petya')], mode='update')
+
+    with pytest.raises(AssertionError):
+        await employees.save_many([vasya], mode='replace')
@@ -0,0 +1,26 @@
+import pytest
+
+from pymotyc import engine, get_client
+
+
+def test_get_client_motor_is_shared():
+    assert get_client('mongodb://localhost', max_pool_size=10) is get_client('mongodb://localhost', max_pool_size=10)
+    assert get_client('mongodb://localhost') is not get_client('mongodb://localhost', max_pool_size=10)
+
+
+def test_get_client_pymongo(monkeypatch):
+    class MockAsyncMongoClient:
+        def __init__(self, uri, **kwargs):
+            self.uri = uri
+            self.kwargs = kwargs
+
+    monkeypatch.setattr(engine, 'AsyncMongoClient', MockAsyncMongoClient)
+    client = get_client('mongodb://localhost', driver='pymongo', max_pool_size=10)
+    assert isinstance(client, MockAsyncMongoClient)
+    assert client.kwargs == {'maxPoolSize': 10}
+    # Tied to the event loop it runs on, so never shared.
+    assert get_client('mongodb://localhost', driver='pymongo') is not get_client('mongodb://localhost', driver='pymongo')
+
+    monkeypatch.setattr(engine, 'AsyncMongoClient', None)
+    with pytest.raises(ImportError):
+        get_client('mongodb://localhost', driver='pymongo')
@@ -0,0 +1,29 @@
+import pytest
+
+from pymotyc import MotycModel
+
+
+class Model(MotycModel):
+    foo: int
+
+
+class MockCollection:
+    def __init__(self):
+        self.calls = []
+
+    async def save_many(self, items, *, mode):
+        self.calls.append(([item.foo for item in items], mode))
+        return [Model(foo=item.foo + 1) for item in items]
+
+
+@pytest.mark.asyncio
+async def test_save_many():
+    foo_collection, bar_collection = MockCollection(), MockCollection()
+
+    models = [Model(foo=i) for i in range(4)]
+    for model in models:
+        model._bound_collection = foo_collection if model.foo % 2 else bar_collection
+
+    assert await MotycModel.save_many(models) == [Model(foo=i + 1) for i in range(4)]
+    assert foo_collection.calls == [([1, 3], 'update')]
+    assert bar_collection.calls == [([0, 2], 'update')]
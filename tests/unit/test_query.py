@@ -1,9 +1,9 @@
 from typing import cast
 
-from pydantic import Field
+from pydantic import BaseModel, Field
 
 from pymotyc.model import MotycModel, WithInjected
-from pymotyc.query import MotycQuery, MotycField
+from pymotyc.query import MotycQuery, MotycField, filter_by
 
 
 class Model(WithInjected):
@@ -29,6 +29,10 @@ def test_query_builder_for_motyc_model():
     ))
 
     assert str(query) == '(((((foo==1 AND foo>1) AND foo<1) AND foo>=1) AND foo<=1) AND foo!=1)'
+    assert query.to_mongo_query() == {'$and': [
+        {'foo': {'$eq': 1}}, {'foo': {'$gt': 1}}, {'foo': {'$lt': 1}},
+        {'foo': {'$gte': 1}}, {'foo': {'$lte': 1}}, {'foo': {'$ne': 1}},
+    ]}
 
     query = cast(MotycQuery, (
             (Model.foo == 1) &
@@ -39,8 +43,69 @@ def test_query_builder_for_motyc_model():
     assert query.to_mongo_query() == \
            {'$or': [{'$and': [{'foo': {'$eq': 1}}, {'foo': {'$eq': 2}}]}, {'foo': {'$eq': 3}}]}
 
+    mongo_query = MotycQuery.build_mongo_query(query)
+    assert mongo_query == query.to_mongo_query()
+    assert query._cached is not None  # compiled once
+    mongo_query['foo'] = 1
+    assert MotycQuery.build_mongo_query(query) == query.to_mongo_query()
+
+
+def test_custom_query():
+    class Exists(MotycQuery):
+        def __init__(self, alias: str):
+            self.alias = alias
+
+        def to_mongo_query(self):
+            return {self.alias: {'$exists': True}}
+
+    assert MotycQuery.build_mongo_query(Exists('foo') & Exists('bar')) == \
+           {'$and': [{'foo': {'$exists': True}}, {'bar': {'$exists': True}}]}
+
 
 def test_build_query_from_motyc_fields():
     assert MotycQuery.build_mongo_query(
         {'$and': [{Model.foo: {'$eq': 1}}, {Model.bar: {'$eq': 2}}]}
     ) == {'$and': [{'foo': {'$eq': 1}}, {'bar_alias': {'$eq': 2}}]}
+
+
+def test_build_flat_query():
+    query = {'foo': 1, 'bar_alias': 'a'}
+    assert MotycQuery.build_mongo_query(query) == query
+    assert MotycQuery.build_mongo_query(query) is not query
+    assert MotycQuery.build_mongo_query({Model.foo: 1, Model.bar: -1}) == {'foo': 1, 'bar_alias': -1}
+
+
+def test_filter_by():
+    by_bar = filter_by(Model.bar)
+    assert by_bar(1) == {'bar_alias': 1}
+    assert by_bar(2) == {'bar_alias': 2}
+
+    assert filter_by('foo')(1) == {'foo': 1}
+
+
+def test_startswith():
+    assert MotycQuery.build_mongo_query(cast(MotycField, Model.foo).startswith('a.b')) == \
+           {'foo': {'$regex': r'^a\.b', '$options': ''}}
+
+
+def test_build_query_does_not_modify_query():
+    query = {'$or': [{Model.foo: 1}, {Model.bar: [[2]]}]}
+    mongo_query = MotycQuery.build_mongo_query(query)
+    assert mongo_query == {'$or': [{'foo': 1}, {'bar_alias': [[2]]}]}
+    assert query == {'$or': [{Model.foo: 1}, {Model.bar: [[2]]}]}
+    assert mongo_query['$or'][1]['bar_alias'][0] is not query['$or'][1][Model.bar][0]
+
+
+def test_nested_fields():
+    field = cast(MotycField, Model.foo)
+    assert field.bar.baz.alias == 'foo.bar.baz'
+    assert field.bar is field.bar
+
+
+def test_build_query_with_models():
+    class Value(BaseModel):
+        baz: int
+
+    value = Value(baz=1)
+    mongo_query = MotycQuery.build_mongo_query({'$or': [{'foo': value}, {'bar': value}]})
+    assert mongo_query == {'$or': [{'foo': {'baz': 1}}, {'bar': {'baz': 1}}]}
@@ -25,6 +25,8 @@ def test_get_annotations():
         'x': int,
         'z': str
     }
+    assert get_annotations(C) is get_annotations(C)
+    assert get_annotations(B) == {'x': int, 'z': float}
 
 
 class Model1(BaseModel):